@@ -0,0 +1,111 @@
+"""
+Persistent checksum cache so unchanged files are not rehashed between runs.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+# Stat-derived identity of a file's content: (inode, size, mtime_ns)
+CacheKey = Tuple[int, int, int]
+
+CACHE_FILENAME = ".checksum_cache.sqlite3"
+
+class ChecksumCache:
+    """
+    SQLite-backed mapping of file stat keys to checksums.
+
+    A file whose inode, size and modification time are unchanged since it was
+    last hashed is assumed to have unchanged content.
+    """
+
+    def __init__(self, base_dir: str | Path, algorithm: str):
+        """
+        Initialize ChecksumCache.
+
+        Args:
+            base_dir (Union[str, Path]): Directory in which the cache database is stored
+            algorithm (str): Name of the hash algorithm; entries made with another
+                algorithm are ignored
+        """
+        self.path = Path(base_dir) / CACHE_FILENAME
+        self.algorithm = algorithm
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checksums (
+                algorithm TEXT NOT NULL,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (algorithm, inode, size, mtime_ns)
+            )
+            """
+        )
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """
+        Look up the cached checksum for a file.
+
+        Args:
+            key (CacheKey): (inode, size, mtime_ns) of the file
+
+        Returns:
+            Optional[str]: Cached checksum, or None on a cache miss
+        """
+        row = self._conn.execute(
+            "SELECT digest FROM checksums"
+            " WHERE algorithm = ? AND inode = ? AND size = ? AND mtime_ns = ?",
+            (self.algorithm, *key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: CacheKey, digest: str) -> None:
+        """
+        Store the checksum for a file.
+
+        Args:
+            key (CacheKey): (inode, size, mtime_ns) of the file
+            digest (str): Checksum of the file
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?, ?)",
+            (self.algorithm, *key, digest)
+        )
+
+    def prune(self, live_keys: Iterable[CacheKey]) -> None:
+        """
+        Drop entries for files that no longer exist or have changed.
+
+        Args:
+            live_keys (Iterable[CacheKey]): Keys of every file seen in the current scan
+        """
+        self._conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS live (inode INTEGER, size INTEGER, mtime_ns INTEGER)"
+        )
+        self._conn.execute("DELETE FROM live")
+        self._conn.executemany("INSERT INTO live VALUES (?, ?, ?)", live_keys)
+        self._conn.execute(
+            """
+            DELETE FROM checksums
+            WHERE algorithm != ? OR NOT EXISTS (
+                SELECT 1 FROM live
+                WHERE live.inode = checksums.inode
+                  AND live.size = checksums.size
+                  AND live.mtime_ns = checksums.mtime_ns
+            )
+            """,
+            (self.algorithm,)
+        )
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "ChecksumCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
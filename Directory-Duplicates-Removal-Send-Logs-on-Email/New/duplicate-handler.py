@@ -1,11 +1,24 @@
 """
 Module for detecting and removing duplicate files based on their checksums.
 """
-from typing import Dict, Set, List, Tuple
+from collections import defaultdict
+from typing import Dict, Set, List, Optional, Tuple
 from pathlib import Path
 import logging
+import os
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+# Handlers are configured once by the application (see utils.setup_logging)
+logger.addHandler(logging.NullHandler())
+
+def _inode(path: str) -> int:
+    """Return the inode of a path, or 0 if it cannot be stat'ed."""
+    try:
+        return os.stat(path, follow_symlinks=False).st_ino
+    except OSError:
+        return 0
+
 class DuplicateHandler:
     """
     Class to handle detection and removal of duplicate files.
@@ -19,67 +32,82 @@ class DuplicateHandler:
             base_dir (Union[str, Path]): Base directory for operations
         """
         self.base_dir = Path(base_dir)
-        self._setup_logging()
-        
-    def _setup_logging(self) -> None:
-        """Configure logging for the duplicate handler."""
-        logging.basicConfig(
-            filename=self.base_dir / "duplicate_operations.log",
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
         
     def find_duplicates(self, checksums: Dict[str, str]) -> Dict[str, List[str]]:
         """
         Find duplicate files based on their checksums.
         
         Args:
-            checksums (Dict[str, str]): Dictionary of filename to checksum mappings
+            checksums (Dict[str, str]): Dictionary of relative file path to checksum mappings
             
         Returns:
-            Dict[str, List[str]]: Dictionary mapping checksums to lists of duplicate filenames
+            Dict[str, List[str]]: Dictionary mapping checksums to lists of duplicate file paths
         """
-        checksum_groups: Dict[str, List[str]] = {}
+        # First file seen per checksum; only promoted to a group once a second
+        # file with the same checksum shows up, so no filtering pass is needed
+        seen: Dict[str, str] = {}
+        checksum_groups: Dict[str, List[str]] = defaultdict(list)
         
         for filename, checksum in checksums.items():
-            if checksum in checksum_groups:
-                checksum_groups[checksum].append(filename)
-            else:
-                checksum_groups[checksum] = [filename]
+            first = seen.setdefault(checksum, filename)
+            if first == filename:
+                continue
+            group = checksum_groups[checksum]
+            if not group:
+                group.append(first)
+            group.append(filename)
                 
-        # Filter out unique files
-        return {k: v for k, v in checksum_groups.items() if len(v) > 1}
+        return dict(checksum_groups)
         
-    def remove_duplicates(self, duplicate_groups: Dict[str, List[str]]) -> Tuple[int, List[str]]:
+    def remove_duplicates(
+        self,
+        duplicate_groups: Dict[str, List[str]],
+        inodes: Optional[Dict[str, int]] = None
+    ) -> Tuple[int, List[str]]:
         """
         Remove duplicate files, keeping only one copy of each.
         
+        Files are unlinked in ascending inode order (except on Windows), which
+        keeps filesystem metadata updates close together on disk.
+        
         Args:
-            duplicate_groups (Dict[str, List[str]]): Groups of duplicate files
+            duplicate_groups (Dict[str, List[str]]): Groups of duplicate file paths,
+                relative to base_dir
+            inodes (Optional[Dict[str, int]]): Known inode numbers by file path, as
+                collected by scan_directory; missing entries are looked up with stat
             
         Returns:
-            Tuple[int, List[str]]: Number of files removed and list of removed filenames
+            Tuple[int, List[str]]: Number of files removed and list of removed file paths
             
         Raises:
             PermissionError: If unable to remove files
         """
         removed_count = 0
         removed_files = []
+        base = str(self.base_dir) + os.sep
         
-        for checksum, filenames in duplicate_groups.items():
-            # Keep the first file, remove the rest
-            for filename in filenames[1:]:
-                try:
-                    filepath = self.base_dir / filename
-                    filepath.unlink()
-                    removed_count += 1
-                    removed_files.append(filename)
-                    logging.info(f"Removed duplicate file: {filename}")
-                except PermissionError:
-                    logging.error(f"Permission denied when trying to remove: {filename}")
-                    raise
-                except Exception as e:
-                    logging.error(f"Error removing {filename}: {str(e)}")
-                    raise
+        # Keep the first file of each group, remove the rest
+        to_remove = [
+            filename
+            for filenames in duplicate_groups.values()
+            for filename in filenames[1:]
+        ]
+        if os.name != "nt":
+            known = inodes or {}
+            to_remove.sort(key=lambda filename: known.get(filename) or _inode(base + filename))
+            
+        for filename in to_remove:
+            try:
+                os.unlink(base + filename)
+                removed_count += 1
+                removed_files.append(filename)
+                logger.debug("Removed duplicate file: %s", filename)
+            except PermissionError:
+                logger.error("Permission denied when trying to remove: %s", filename)
+                raise
+            except Exception as e:
+                logger.error("Error removing %s: %s", filename, e)
+                raise
                     
+        logger.info("Removed %d duplicate files", removed_count)
         return removed_count, removed_files
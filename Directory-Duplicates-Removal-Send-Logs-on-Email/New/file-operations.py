@@ -3,47 +3,189 @@ File system operations module for handling file scanning and checksum generation
 """
 import os
 import hashlib
-from typing import Dict, Optional
+import mmap
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
-def generate_file_checksum(filepath: str | Path, chunk_size: int = 4096) -> str:
+from checksum_cache import CACHE_FILENAME, CacheKey, ChecksumCache
+from utils import LOG_FILENAME
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Name of the algorithm used by generate_file_checksum, for cache bookkeeping
+CHECKSUM_ALGORITHM = "blake3" if blake3 is not None else "md5"
+
+# Checksum of zero-byte input, so empty files never need to be opened
+_EMPTY_CHECKSUM = (blake3.blake3() if blake3 is not None else hashlib.md5()).hexdigest()
+
+# Worker counts for checksum threads. Small files (<= HEAD_SIZE) are dominated
+# by open/read syscall latency, so many threads help hide it; large files are
+# bound by disk bandwidth and only need a few.
+SMALL_FILE_WORKERS = 64
+LARGE_FILE_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Number of leading bytes hashed to pre-filter same-size files
+HEAD_SIZE = 64 * 1024
+
+# Files at least this large are memory-mapped for hashing; below it the
+# mapping setup costs more than the buffer copies it saves
+MMAP_THRESHOLD = 1 << 20
+
+# hashlib.file_digest is only available on Python 3.11+
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
+# posix_fadvise is not available on Windows
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Windows needs O_BINARY to avoid newline translation on os.open
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# mmap.madvise needs Python 3.8+ and a POSIX platform
+_HAS_MADV_SEQUENTIAL = hasattr(mmap, "MADV_SEQUENTIAL")
+
+def _scandir_recursive(path: str | Path) -> Iterator[os.DirEntry]:
     """
-    Generate MD5 checksum for a given file.
+    Recursively yield file entries under a directory using os.scandir.
+    
+    DirEntry caches the file type from the directory read, so no extra
+    stat() call is needed per entry. Symlinks are skipped and unreadable
+    subdirectories are silently ignored.
     
     Args:
-        filepath (Union[str, Path]): Path to the file
-        chunk_size (int): Size of chunks to read at once (default: 4096 bytes)
+        path (Union[str, Path]): Directory to walk
+        
+    Yields:
+        os.DirEntry: Entry for each regular file found
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+                elif entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+    except PermissionError:
+        pass
+
+def generate_file_checksum(filepath: str | os.PathLike, chunk_size: int = 1 << 20) -> str:
+    """
+    Generate a content checksum for a given file.
+    
+    Uses BLAKE3 when the optional ``blake3`` package is installed, otherwise
+    falls back to MD5. Only equality of checksums matters for duplicate
+    detection, so either algorithm works as long as one run uses the same one.
+    
+    Args:
+        filepath (Union[str, os.PathLike]): Path to the file
+        chunk_size (int): Size of chunks to read at once when hashlib.file_digest
+            is unavailable (default: 1 MiB)
     
     Returns:
-        str: Hexadecimal representation of the MD5 hash
+        str: Hexadecimal representation of the hash
         
     Raises:
         FileNotFoundError: If the specified file doesn't exist
         PermissionError: If the program lacks permission to read the file
     """
-    hash_md5 = hashlib.md5()
-    
-    filepath = Path(filepath)
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    # Work on the plain string path; open() raises FileNotFoundError itself,
+    # so there is no separate existence check
+    filepath = os.fspath(filepath)
         
     try:
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        if blake3 is not None:
+            # Memory-maps the file and hashes it with SIMD across threads
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(filepath)
+            return hasher.hexdigest()
+        
+        # file_digest runs the read loop in C with its own buffer
+        fd = os.open(filepath, os.O_RDONLY | _O_BINARY)
+        with os.fdopen(fd, "rb", buffering=0 if _HAS_FILE_DIGEST else chunk_size) as f:
+            if _HAS_FADVISE:
+                # Sequential read: let the kernel use its largest readahead window
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            try:
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    # Hash straight from the page cache without user-space copies
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if _HAS_MADV_SEQUENTIAL:
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher = hashlib.md5()
+                        hasher.update(mm)
+                        return hasher.hexdigest()
+                
+                if _HAS_FILE_DIGEST:
+                    return hashlib.file_digest(f, "md5").hexdigest()
+                
+                hasher = hashlib.md5()
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    hasher.update(chunk)
+                return hasher.hexdigest()
+            finally:
+                if _HAS_FADVISE:
+                    # The file is not read again, so don't let it crowd the page cache
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
     except PermissionError:
         raise PermissionError(f"Permission denied to read file: {filepath}")
 
-def scan_directory(directory_path: str | Path) -> Dict[str, str]:
+def _generate_head_checksum(filepath: str | Path, head_size: int = HEAD_SIZE) -> str:
     """
-    Scan a directory and generate checksums for all files.
+    Generate a checksum of only the first ``head_size`` bytes of a file.
+    
+    Used as a cheap pre-filter: files whose heads differ cannot be duplicates.
+    
+    Args:
+        filepath (Union[str, Path]): Path to the file
+        head_size (int): Number of leading bytes to hash (default: HEAD_SIZE)
+        
+    Returns:
+        str: Hexadecimal representation of the hash of the file head
+    """
+    with open(filepath, "rb") as f:
+        head = f.read(head_size)
+    hasher = blake3.blake3() if blake3 is not None else hashlib.md5()
+    hasher.update(head)
+    return hasher.hexdigest()
+
+def scan_directory(
+    directory_path: str | Path,
+    small_workers: int = SMALL_FILE_WORKERS,
+    large_workers: int = LARGE_FILE_WORKERS,
+    cache: Optional[ChecksumCache] = None,
+    inodes: Optional[Dict[str, int]] = None
+) -> Dict[str, str]:
+    """
+    Scan a directory and generate checksums for files that may be duplicates.
+    
+    Files are first grouped by size; a file with a unique size cannot have a
+    duplicate and is never hashed. Within same-size groups of large files only
+    the first HEAD_SIZE bytes are hashed, and the full checksum is computed
+    only when those head checksums collide. Small and large files are hashed
+    in separate thread pools while the walk is still in progress, and files
+    whose stat key is found in ``cache`` are not hashed at all. The checksum
+    cache and the operations log at the top of ``directory_path`` are skipped.
     
     Args:
         directory_path (Union[str, Path]): Path to the directory to scan
+        small_workers (int): Threads hashing files up to HEAD_SIZE bytes, including
+            head checksums of large files (default: SMALL_FILE_WORKERS)
+        large_workers (int): Threads fully hashing files larger than HEAD_SIZE
+            (default: LARGE_FILE_WORKERS)
+        cache (Optional[ChecksumCache]): Persistent cache consulted before hashing
+            a file and updated with new checksums; stale entries are pruned
+        inodes (Optional[Dict[str, int]]): If given, filled with the inode number
+            of every returned file, taken from the stat done during the walk
         
     Returns:
-        Dict[str, str]: Dictionary mapping filenames to their checksums
+        Dict[str, str]: Dictionary mapping file paths relative to ``directory_path``
+        to their checksums, for duplicate candidates only
         
     Raises:
         NotADirectoryError: If the specified path is not a directory
@@ -56,9 +198,77 @@ def scan_directory(directory_path: str | Path) -> Dict[str, str]:
     checksums: Dict[str, str] = {}
     
     try:
-        for filepath in directory_path.rglob("*"):
-            if filepath.is_file():
-                checksums[filepath.name] = generate_file_checksum(filepath)
+        with ThreadPoolExecutor(max_workers=small_workers) as small_executor, \
+                ThreadPoolExecutor(max_workers=large_workers) as large_executor:
+            pending = []
+            
+            def submit(file: Tuple[str, str, CacheKey]) -> None:
+                name, path, key = file
+                if key[1] == 0:
+                    digest = _EMPTY_CHECKSUM
+                else:
+                    digest = cache.get(key) if cache is not None else None
+                executor = small_executor if key[1] <= HEAD_SIZE else large_executor
+                future = executor.submit(generate_file_checksum, path) if digest is None else None
+                pending.append((name, key, digest, future))
+                
+            # Small files are hashed as soon as a second file of their size is
+            # found, so hashing overlaps with the rest of the directory walk
+            size_groups: Dict[int, List[Tuple[str, str, CacheKey]]] = defaultdict(list)
+            root_len = len(os.path.join(str(directory_path), ""))
+            for entry in _scandir_recursive(directory_path):
+                # Key by path relative to the scanned directory so files with the
+                # same name in different subdirectories don't collide
+                rel_path = entry.path[root_len:]
+                # Never treat our own cache or the run's log (still empty at this
+                # point) as duplicates
+                if rel_path.startswith((CACHE_FILENAME, LOG_FILENAME)):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                file = (rel_path, entry.path, (entry.inode(), stat.st_size, stat.st_mtime_ns))
+                group = size_groups[stat.st_size]
+                group.append(file)
+                if stat.st_size <= HEAD_SIZE:
+                    if len(group) == 2:
+                        submit(group[0])
+                    if len(group) >= 2:
+                        submit(file)
+                        
+            if cache is not None:
+                cache.prune(key for group in size_groups.values() for _, _, key in group)
+                
+            # Large files need the whole size group before deciding what to hash
+            head_futures = []
+            for size, group in size_groups.items():
+                if size <= HEAD_SIZE or len(group) < 2:
+                    continue
+                if cache is not None and all(cache.get(key) for _, _, key in group):
+                    for file in group:
+                        submit(file)
+                else:
+                    # Pre-filter large same-size files on a checksum of their head
+                    head_futures.extend(
+                        (size, file, small_executor.submit(_generate_head_checksum, file[1]))
+                        for file in group
+                    )
+                    
+            head_groups: Dict[Tuple[int, str], List[Tuple[str, str, CacheKey]]] = defaultdict(list)
+            for size, file, future in head_futures:
+                head_groups[(size, future.result())].append(file)
+            for group in head_groups.values():
+                if len(group) > 1:
+                    for file in group:
+                        submit(file)
+                        
+            # Collect in walk order so the "first" file of each group is stable
+            for name, key, digest, future in pending:
+                if future is not None:
+                    digest = future.result()
+                    if cache is not None:
+                        cache.set(key, digest)
+                checksums[name] = digest
+                if inodes is not None:
+                    inodes[name] = key[0]
         return checksums
     except PermissionError:
         raise PermissionError(f"Permission denied to access directory: {directory_path}")
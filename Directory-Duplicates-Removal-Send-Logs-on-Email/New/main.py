@@ -5,10 +5,11 @@ Handles duplicate file detection, removal, and notification.
 from pathlib import Path
 import argparse
 import sys
-from typing import Optional
+from typing import Dict, Optional
 
+from checksum_cache import ChecksumCache
 from duplicate_handler import DuplicateHandler
-from file_operations import scan_directory
+from file_operations import CHECKSUM_ALGORITHM, scan_directory
 from utils import EmailNotifier, setup_logging
 
 def parse_arguments():
@@ -37,8 +38,8 @@ def main():
             sys.exit(1)
             
         # Initialize components
+        log_file = setup_logging(base_dir)
         handler = DuplicateHandler(base_dir)
-        setup_logging(base_dir)
         
         # Set up email notifier if email parameters are provided
         email_notifier: Optional[EmailNotifier] = None
@@ -52,8 +53,10 @@ def main():
         
         # Scan directory and generate checksums
         print(f"Scanning directory: {base_dir}")
-        checksums = scan_directory(base_dir)
-        print(f"Found {len(checksums)} files")
+        inodes: Dict[str, int] = {}
+        with ChecksumCache(base_dir, CHECKSUM_ALGORITHM) as cache:
+            checksums = scan_directory(base_dir, cache=cache, inodes=inodes)
+        print(f"Found {len(checksums)} candidate files with matching sizes")
         
         # Find duplicates
         duplicate_groups = handler.find_duplicates(checksums)
@@ -66,18 +69,19 @@ def main():
             
         # Remove duplicates
         print("Removing duplicate files...")
-        removed_count, removed_files = handler.remove_duplicates(duplicate_groups)
+        removed_count, removed_files = handler.remove_duplicates(duplicate_groups, inodes)
         print(f"Successfully removed {removed_count} duplicate files")
         
         # Send email report if configured
         if email_notifier and args.email:
             print("Sending email report...")
             try:
-                email_notifier.send_report(
-                    recipient_email=args.email,
-                    removed_files=removed_files,
-                    log_file=base_dir / "duplicate_operations.log"
-                )
+                with email_notifier:
+                    email_notifier.send_report(
+                        recipient_email=args.email,
+                        removed_files=removed_files,
+                        log_file=log_file
+                    )
                 print("Email report sent successfully")
             except Exception as e:
                 print(f"Failed to send email report: {str(e)}")
@@ -1,19 +1,32 @@
 """
 Utility functions for file operations, logging, and email notifications.
 """
+import gzip
+import io
+import shutil
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from email.message import EmailMessage
+from email.policy import SMTP
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 import logging
 
+# Name of the operations log written to the scanned directory
+LOG_FILENAME = "duplicate_operations.log"
+
+# Port on which SMTP servers expect implicit TLS
+SMTPS_PORT = 465
+
+# Read size used when compressing the log attachment
+ATTACHMENT_CHUNK_SIZE = 64 * 1024
+
 class EmailNotifier:
     """
     Class to handle email notifications about duplicate file operations.
+    
+    The SMTP connection is opened on the first send and reused afterwards;
+    use the notifier as a context manager (or call close()) to release it.
     """
     
     def __init__(self, sender_email: str, sender_password: str, smtp_server: str = "smtp.gmail.com", smtp_port: int = 587):
@@ -30,6 +43,52 @@ class EmailNotifier:
         self.sender_password = sender_password
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        self._smtp: Optional[smtplib.SMTP] = None
+        
+    def __enter__(self) -> "EmailNotifier":
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
+    def _get_connection(self) -> smtplib.SMTP:
+        """
+        Return a logged-in SMTP connection, reusing the previous one if still alive.
+        
+        Returns:
+            smtplib.SMTP: Authenticated SMTP connection
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.close()
+            
+        # Implicit TLS on the SMTPS port saves the STARTTLS round trip
+        implicit_tls = self.smtp_port == SMTPS_PORT
+        smtp_class = smtplib.SMTP_SSL if implicit_tls else smtplib.SMTP
+        server = smtp_class(self.smtp_server, self.smtp_port)
+        try:
+            if not implicit_tls:
+                server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+        
+    def close(self) -> None:
+        """Close the SMTP connection if one is open."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
         
     def send_report(self, recipient_email: str, removed_files: List[str], log_file: Path) -> None:
         """
@@ -38,12 +97,12 @@ class EmailNotifier:
         Args:
             recipient_email (str): Email address to send report to
             removed_files (List[str]): List of removed duplicate files
-            log_file (Path): Path to the log file to attach
+            log_file (Path): Path to the log file to attach (sent gzip-compressed)
             
         Raises:
             smtplib.SMTPException: If there's an error sending the email
         """
-        msg = MIMEMultipart()
+        msg = EmailMessage(policy=SMTP)
         msg['From'] = self.sender_email
         msg['To'] = recipient_email
         msg['Subject'] = f"Duplicate Files Removal Report - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
@@ -59,36 +118,41 @@ class EmailNotifier:
         Please see the attached log file for details.
         """
         
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
         
-        # Attach log file
-        with open(log_file, "rb") as f:
-            part = MIMEBase('application', 'octet-stream')
-            part.set_payload(f.read())
-            encoders.encode_base64(part)
-            part.add_header('Content-Disposition', f'attachment; filename="{log_file.name}"')
-            msg.attach(part)
+        # Attach log file, gzipped in chunks since log text compresses well
+        buffer = io.BytesIO()
+        with open(log_file, "rb") as f, gzip.GzipFile(fileobj=buffer, mode="wb") as gz:
+            shutil.copyfileobj(f, gz, ATTACHMENT_CHUNK_SIZE)
+        msg.add_attachment(
+            buffer.getvalue(),
+            maintype='application',
+            subtype='gzip',
+            filename=f"{log_file.name}.gz"
+        )
             
-        # Send email
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            server.send_message(msg)
+        # Send email over the shared connection
+        self._get_connection().send_message(msg)
 
-def setup_logging(log_dir: Path) -> None:
+def setup_logging(log_dir: Path) -> Path:
     """
     Set up logging configuration.
     
+    Replaces any existing root handlers, so this is the single place where
+    logging is configured.
+    
     Args:
         log_dir (Path): Directory to store log files
+        
+    Returns:
+        Path: Path to the log file
     """
-    log_file = log_dir / f"duplicate_removal_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    log_file = log_dir / LOG_FILENAME
     
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
+        handlers=[logging.FileHandler(log_file)],
+        force=True
     )
+    return log_file
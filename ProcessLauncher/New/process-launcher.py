@@ -6,13 +6,45 @@ Only runs executables from the Windows System32 directory for security.
 """
 
 import subprocess
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 import logging
 import sys
 from dataclasses import dataclass
 
+# Maximum number of processes created concurrently
+MAX_LAUNCH_WORKERS = 16
+
+# Resolved once; SystemRoot does not change during the process lifetime
+_SYSTEM32 = Path(os.environ.get('SystemRoot', 'C:\\Windows')) / 'System32'
+
+@functools.lru_cache(maxsize=None)
+def _system32_listing() -> frozenset:
+    """Snapshot the lower-cased file names in System32 for O(1) lookups."""
+    try:
+        return frozenset(name.lower() for name in os.listdir(_SYSTEM32))
+    except OSError:
+        return frozenset()
+
+@functools.lru_cache(maxsize=None)
+def _system32_exe_exists(process_name: str) -> Optional[Path]:
+    """
+    Look up an executable in System32.
+    
+    Args:
+        process_name: Name of the process (without .exe extension)
+        
+    Returns:
+        Optional[Path]: Path to the executable, or None if it is not in System32
+    """
+    exe_name = f"{process_name}.exe"
+    if exe_name.lower() not in _system32_listing():
+        return None
+    return _SYSTEM32 / exe_name
+
 @dataclass
 class ProcessConfig:
     """Configuration for a process to be launched."""
@@ -34,10 +66,9 @@ class ProcessConfig:
             ValueError: If the process executable doesn't exist in System32
         """
         # Ensure we only work with System32 for security
-        system32_path = Path(os.environ.get('SystemRoot', 'C:\\Windows')) / 'System32'
-        executable_path = system32_path / f"{process_name}.exe"
+        executable_path = _system32_exe_exists(process_name)
         
-        if not executable_path.exists():
+        if executable_path is None:
             raise ValueError(f"Process {process_name} not found in System32 directory")
             
         return cls(
@@ -67,9 +98,11 @@ class ProcessLauncher:
             IOError: If there's an error reading the file
         """
         try:
-            with open(config_file, 'r') as f:
-                # Filter out empty lines and strip whitespace
-                return [line.strip() for line in f if line.strip()]
+            with open(config_file, 'rb') as f:
+                data = f.read()
+            # Split once in C, then filter out empty lines and strip whitespace
+            lines = (line.strip() for line in data.split(b"\n"))
+            return [line.decode() for line in lines if line]
         except FileNotFoundError:
             self.logger.error(f"Configuration file not found: {config_file}")
             raise
@@ -113,18 +146,28 @@ class ProcessLauncher:
             List[subprocess.Popen]: List of successfully launched process handles
         """
         process_list = self.read_process_list(config_file)
-        launched_processes = []
         
-        for process_name in process_list:
-            try:
-                config = ProcessConfig.from_name(process_name)
-                if process := self.launch_process(config):
-                    launched_processes.append(process)
-            except ValueError as e:
-                self.logger.error(str(e))
-                continue
-            except subprocess.SubprocessError as e:
-                self.logger.error(f"Failed to launch {process_name}: {e}")
-                continue
-                
-        return launched_processes
+        # Popen returns once the process is created, so threads only hide
+        # the per-process creation latency
+        with ThreadPoolExecutor(max_workers=MAX_LAUNCH_WORKERS) as executor:
+            results = executor.map(self._try_launch, process_list)
+            return [process for process in results if process is not None]
+            
+    def _try_launch(self, process_name: str) -> Optional[subprocess.Popen]:
+        """
+        Validate and launch a single process by name, logging any failure.
+        
+        Args:
+            process_name: Name of the process (without .exe extension)
+            
+        Returns:
+            Optional[subprocess.Popen]: Process handle if successful, None otherwise
+        """
+        try:
+            config = ProcessConfig.from_name(process_name)
+            return self.launch_process(config)
+        except ValueError as e:
+            self.logger.error(str(e))
+        except subprocess.SubprocessError as e:
+            self.logger.error(f"Failed to launch {process_name}: {e}")
+        return None
@@ -1,19 +1,145 @@
 """
 Module for logging process information to files and sending email reports.
 """
+import base64
 import json
+import mmap
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from email.header import Header
+from email.utils import formataddr, formatdate, make_msgid, parseaddr
 import logging
 import ProcessInfo
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_RECORD_FORMAT = (
+    b'{"pid":%d,"name":%b,"username":%b,"memory_mb":%.2f,'
+    b'"create_time":%b,"cpu_percent":%b}\n'
+)
+
+def _json_string(value: str) -> bytes:
+    """Encode a string as a JSON string literal."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode('ascii')
+
+# MIME boundary; it cannot occur in the base64 attachment or the fixed body text
+_BOUNDARY = b'===PROCESS-REPORT-BOUNDARY==='
+
+_HEADER_TEMPLATE = (
+    b'From: {from}\r\n'
+    b'To: {to}\r\n'
+    b'Subject: {subject}\r\n'
+    b'Date: {date}\r\n'
+    b'Message-ID: {msgid}\r\n'
+    b'MIME-Version: 1.0\r\n'
+    b'Content-Type: multipart/mixed; boundary="' + _BOUNDARY + b'"\r\n'
+    b'\r\n'
+)
+
+_BODY_PART_TEMPLATE = (
+    b'--' + _BOUNDARY + b'\r\n'
+    b'Content-Type: text/plain; charset="us-ascii"\r\n'
+    b'Content-Transfer-Encoding: 7bit\r\n'
+    b'\r\n'
+    b'Process Information Report\r\n'
+    b'Generated at: {generated}\r\n'
+    b'\r\n'
+    b'Please find the detailed process information in the attached log file.\r\n'
+    b'\r\n'
+)
+
+_ATTACHMENT_PART_TEMPLATE = (
+    b'--' + _BOUNDARY + b'\r\n'
+    b'Content-Type: application/octet-stream\r\n'
+    b'Content-Transfer-Encoding: base64\r\n'
+    b'Content-Disposition: attachment; filename="{filename}"\r\n'
+    b'\r\n'
+)
+
+# 57 input bytes encode to exactly one 76-character base64 line (RFC 2045);
+# the attachment is encoded this many lines at a time
+_BASE64_LINE_INPUT = 57
+_BASE64_BLOCK_SIZE = _BASE64_LINE_INPUT * 1024
+
+_CLOSING_DELIMITER = b'--' + _BOUNDARY + b'--\r\n'
+
+# RFC 5322 limit on the length of a single line, excluding the CRLF
+_MAX_LINE_LENGTH = 998
+
+def _encode_header(name: str, value: str) -> bytes:
+    """
+    Encode a header value for splicing into a CRLF-terminated header block.
+    
+    Non-ASCII text becomes RFC 2047 encoded words and lines too long for SMTP
+    are folded, with CRLF as the folding line break.
+    
+    Args:
+        name: Header field name, used to size the first line
+        value: Unencoded header value
+        
+    Returns:
+        bytes: Encoded header value
+        
+    Raises:
+        ValueError: If the value contains a line break, or cannot be folded
+            to within the SMTP line length limit
+    """
+    if '\r' in value or '\n' in value:
+        raise ValueError(f"Line break in {name} header value: {value!r}")
+    if value.isascii() and len(name) + 2 + len(value) <= _MAX_LINE_LENGTH:
+        return value.encode('ascii')
+        
+    charset = 'us-ascii' if value.isascii() else 'utf-8'
+    encoded = Header(value, charset, header_name=name).encode(linesep='\r\n')
+    lines = encoded.split('\r\n')
+    if len(name) + 2 + len(lines[0]) > _MAX_LINE_LENGTH or any(
+        len(line) > _MAX_LINE_LENGTH for line in lines[1:]
+    ):
+        raise ValueError(f"{name} header value cannot be folded to {_MAX_LINE_LENGTH} characters")
+    return encoded.encode('ascii')
+
+def _encode_address(name: str, value: str) -> bytes:
+    """
+    Encode an address header value such as 'Name <user@example.com>'.
+    
+    Only the display name may contain non-ASCII text; it becomes an RFC 2047
+    encoded word while the addr-spec is kept as is.
+    
+    Args:
+        name: Header field name
+        value: Address, optionally with a display name
+        
+    Returns:
+        bytes: Encoded header value
+        
+    Raises:
+        ValueError: If the value contains a line break, has no parsable ASCII
+            address, or does not fit within the SMTP line length limit
+    """
+    if '\r' in value or '\n' in value:
+        raise ValueError(f"Line break in {name} header value: {value!r}")
+    display_name, address = parseaddr(value)
+    if not address or not address.isascii():
+        raise ValueError(f"Invalid or non-ASCII address in {name} header: {value!r}")
+    encoded = formataddr((display_name, address), charset='utf-8')
+    if len(name) + 2 + len(encoded) > _MAX_LINE_LENGTH:
+        raise ValueError(f"{name} header value exceeds {_MAX_LINE_LENGTH} characters")
+    return encoded.encode('ascii')
+
+def _json_number(value: Optional[float]) -> bytes:
+    """Encode a number as JSON, using null for values psutil could not read."""
+    return b'null' if value is None else repr(value).encode('ascii')
+
 class ProcessLogger:
     """Class to handle logging of process information."""
     
@@ -25,7 +151,6 @@ class ProcessLogger:
             base_dir: Base directory for log files
         """
         self.base_dir = Path(base_dir)
-        self.logger = logging.getLogger(__name__)
         
     def create_log_directory(self, dir_name: str) -> Path:
         """
@@ -55,25 +180,31 @@ class ProcessLogger:
         log_file = log_dir / "process_log.txt"
         
         try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                f.write('=' * 80 + '\n')
-                f.write(f'Process Log - {datetime.now().isoformat()}\n')
-                f.write('=' * 80 + '\n\n')
+            buf = bytearray(
+                (
+                    '=' * 80 + '\n'
+                    + f'Process Log - {datetime.now().isoformat()}\n'
+                    + '=' * 80 + '\n\n'
+                ).encode('utf-8')
+            )
+            # One JSON object per line, formatted directly for the fixed
+            # ProcessInfo shape instead of going through an intermediate dict
+            for proc in processes:
+                buf += _RECORD_FORMAT % (
+                    proc.pid,
+                    _json_string(proc.name),
+                    _json_string(proc.username),
+                    proc.memory_mb,
+                    _json_number(proc.create_time),
+                    _json_number(proc.cpu_percent)
+                )
                 
-                for proc in processes:
-                    json.dump({
-                        'pid': proc.pid,
-                        'name': proc.name,
-                        'username': proc.username,
-                        'memory_mb': proc.memory_mb,
-                        'create_time': proc.create_time,
-                        'cpu_percent': proc.cpu_percent
-                    }, f, indent=2)
-                    f.write('\n')
+            with open(log_file, 'wb') as f:
+                f.write(buf)
                     
             return log_file
         except Exception as e:
-            self.logger.error(f"Error writing log file: {str(e)}")
+            logger.error(f"Error writing log file: {str(e)}")
             raise
 
 class EmailReporter:
@@ -89,7 +220,119 @@ class EmailReporter:
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
-        self.logger = logging.getLogger(__name__)
+        
+    def _build_head(
+        self,
+        sender_email: str,
+        recipient_email: str,
+        log_file: Path,
+        subject: str
+    ) -> bytes:
+        """
+        Assemble the report up to the start of the base64 attachment data.
+        
+        The message always has the same shape, so it is filled into fixed byte
+        templates instead of being built and flattened by the email package.
+        
+        Args:
+            sender_email: Email address to send from
+            recipient_email: Email address to send to
+            log_file: Path to the log file to attach
+            subject: Email subject line
+            
+        Returns:
+            bytes: Headers, text part and attachment part headers, with CRLF
+            line endings
+            
+        Raises:
+            ValueError: If a header value contains a line break or is too long
+        """
+        header = (
+            _HEADER_TEMPLATE
+            .replace(b'{from}', _encode_address('From', sender_email))
+            .replace(b'{to}', _encode_address('To', recipient_email))
+            .replace(b'{subject}', _encode_header('Subject', subject))
+            .replace(b'{date}', formatdate(localtime=True).encode('ascii'))
+            .replace(b'{msgid}', make_msgid().encode('ascii'))
+        )
+        body = _BODY_PART_TEMPLATE.replace(
+            b'{generated}', datetime.now().isoformat().encode('ascii')
+        )
+        attachment_header = _ATTACHMENT_PART_TEMPLATE.replace(
+            b'{filename}', _encode_header('Content-Disposition', log_file.name)
+        )
+        return header + body + attachment_header
+        
+    @staticmethod
+    def _iter_base64(f: BinaryIO) -> Iterator[bytes]:
+        """
+        Yield the base64 encoding of an open file, one block at a time.
+        
+        The file is memory-mapped and only one block of encoded output exists
+        at a time. Lines are 76 characters long with CRLF endings, within the
+        998-octet SMTP line limit.
+        
+        Args:
+            f: File opened in binary mode
+            
+        Yields:
+            bytes: Encoded lines for the next block of the file
+        """
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(0, size, _BASE64_BLOCK_SIZE):
+                yield base64.encodebytes(
+                    mm[offset:offset + _BASE64_BLOCK_SIZE]
+                ).replace(b'\n', b'\r\n')
+                
+    def _send_streamed(
+        self,
+        server: smtplib.SMTP,
+        sender_email: str,
+        recipient_email: str,
+        head: bytes,
+        f: BinaryIO
+    ) -> None:
+        """
+        Send the report with the attachment encoded straight onto the connection.
+        
+        This is what SMTP.sendmail does, except the message is never assembled
+        in memory. No line of the message starts with '.', so no dot-stuffing
+        is needed.
+        
+        Args:
+            server: Connected, authenticated SMTP session
+            sender_email: Envelope sender
+            recipient_email: Envelope recipient
+            head: Message up to the start of the attachment data (see _build_head)
+            f: Log file opened in binary mode
+            
+        Raises:
+            smtplib.SMTPException: If the server refuses the message
+        """
+        code, resp = server.mail(sender_email)
+        if code != 250:
+            server.rset()
+            raise smtplib.SMTPSenderRefused(code, resp, sender_email)
+        code, resp = server.rcpt(recipient_email)
+        if code not in (250, 251):
+            server.rset()
+            raise smtplib.SMTPRecipientsRefused({recipient_email: (code, resp)})
+        code, resp = server.docmd('DATA')
+        if code != 354:
+            server.rset()
+            raise smtplib.SMTPDataError(code, resp)
+            
+        server.send(head)
+        for block in self._iter_base64(f):
+            server.send(block)
+        server.send(_CLOSING_DELIMITER + b'.\r\n')
+        code, resp = server.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, resp)
         
     def send_report(
         self,
@@ -109,41 +352,20 @@ class EmailReporter:
             log_file: Path to the log file to attach
             subject: Email subject line
         """
-        msg = MIMEMultipart()
-        msg['From'] = sender_email
-        msg['To'] = recipient_email
-        msg['Subject'] = subject
-        
-        body = f"""
-        Process Information Report
-        Generated at: {datetime.now().isoformat()}
-        
-        Please find the detailed process information in the attached log file.
-        """
-        
-        msg.attach(MIMEText(body, 'plain'))
-        
-        # Attach log file
         try:
-            with open(log_file, 'rb') as f:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(f.read())
-                encoders.encode_base64(part)
-                part.add_header(
-                    'Content-Disposition',
-                    f'attachment; filename="{log_file.name}"'
-                )
-                msg.attach(part)
+            head = self._build_head(sender_email, recipient_email, log_file, subject)
+            # Open before connecting so a missing file fails before DATA is sent
+            f = open(log_file, 'rb')
         except Exception as e:
-            self.logger.error(f"Error attaching log file: {str(e)}")
+            logger.error(f"Error attaching log file: {str(e)}")
             raise
             
         # Send email
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+            with f, smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                 server.starttls()
                 server.login(sender_email, sender_password)
-                server.send_message(msg)
+                self._send_streamed(server, sender_email, recipient_email, head, f)
         except Exception as e:
-            self.logger.error(f"Error sending email: {str(e)}")
+            logger.error(f"Error sending email: {str(e)}")
             raise
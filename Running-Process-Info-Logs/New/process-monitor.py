@@ -3,11 +3,45 @@ Core module for process monitoring and information gathering.
 Provides functionality to collect and filter process information using psutil.
 """
 import psutil
-from typing import List, Dict, Any, Optional
+import functools
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Attributes collected for a single process by get_process_info
+PROCESS_ATTRS = ['pid', 'name', 'username', 'memory_info', 'create_time', 'cpu_percent']
+
+BYTES_PER_MB = 1048576.0
+
+# Process tables smaller than this are read serially; a thread pool does not pay off
+PARALLEL_MIN_PROCESSES = 50
+MAX_SCAN_WORKERS = min(8, os.cpu_count() or 4)
+
+# Seconds between the priming and the measuring CPU sample on the first pass
+CPU_SAMPLE_INTERVAL = 0.1
+
+# On Linux, process details are parsed straight from /proc instead of psutil
+_IS_LINUX = sys.platform.startswith('linux')
+
+if _IS_LINUX:
+    import pwd
+    _CLK_TCK = os.sysconf('SC_CLK_TCK')
+
+@functools.lru_cache(maxsize=None)
+def _username_for_uid(uid: int) -> str:
+    """Resolve a UID to a user name, falling back to the numeric UID."""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
 @dataclass
 class ProcessInfo:
     """Data class to store process information in a structured way."""
@@ -18,12 +52,30 @@ class ProcessInfo:
     create_time: float
     cpu_percent: float
 
+@dataclass
+class _CachedProcess:
+    """A psutil.Process handle kept across monitoring cycles with its immutable attributes."""
+    process: psutil.Process
+    name: str
+    username: str
+    create_time: float
+
 class ProcessMonitor:
     """Class to handle process monitoring and information gathering."""
     
     def __init__(self):
         """Initialize the ProcessMonitor."""
-        self.logger = logging.getLogger(__name__)
+        self._proc_cache: Dict[int, _CachedProcess] = {}
+        # (pid, start ticks) -> (cpu ticks, monotonic time) from the previous /proc pass
+        self._cpu_samples: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        # Set once a full pass has sampled every process; name searches only
+        # sample their matches, so they do not count
+        self._has_full_baseline = False
+        # Boot time never changes while we run, so format it only once
+        self._boot_time = psutil.boot_time()
+        self._boot_time_iso = datetime.fromtimestamp(self._boot_time).isoformat()
+        # Prime the system-wide counter so get_system_info can sample without blocking
+        psutil.cpu_percent(interval=None)
     
     def get_process_info(self, process: psutil.Process) -> Optional[ProcessInfo]:
         """
@@ -36,57 +88,408 @@ class ProcessMonitor:
             Optional[ProcessInfo]: Process information if available, None if process cannot be accessed
         """
         try:
-            with process.oneshot():  # Efficient system calls
-                return ProcessInfo(
-                    pid=process.pid,
-                    name=process.name(),
-                    username=process.username(),
-                    memory_mb=process.memory_info().vms / (1024 * 1024),
-                    create_time=process.create_time(),
-                    cpu_percent=process.cpu_percent()
-                )
+            # as_dict fetches all attributes under a single oneshot() scope
+            return self._build_process_info(
+                process.as_dict(attrs=PROCESS_ATTRS, ad_value=None)
+            )
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-            self.logger.debug(f"Could not access process {process.pid}: {str(e)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Could not access process {process.pid}: {str(e)}")
             return None
     
+    @staticmethod
+    def _build_process_info(info: Dict[str, Any]) -> Optional[ProcessInfo]:
+        """
+        Build a ProcessInfo from a psutil attribute dictionary.
+        
+        Args:
+            info: Dictionary of PROCESS_ATTRS values, None where access was denied
+            
+        Returns:
+            Optional[ProcessInfo]: Process information, None if memory info is unavailable
+        """
+        if info['memory_info'] is None:
+            return None
+        return ProcessInfo(
+            pid=info['pid'],
+            name=info['name'] or '',
+            username=info['username'] or '',
+            memory_mb=info['memory_info'].vms / BYTES_PER_MB,
+            create_time=info['create_time'],
+            cpu_percent=info['cpu_percent']
+        )
+    
+    def _get_cached_process(self, pid: int) -> _CachedProcess:
+        """
+        Return the cached handle for a PID, creating it on a miss.
+        
+        A cached handle is reused only while psutil confirms it still refers
+        to the same process (same PID and creation time).
+        
+        Args:
+            pid: Process ID
+            
+        Returns:
+            _CachedProcess: Process handle with its immutable attributes
+            
+        Raises:
+            psutil.NoSuchProcess: If the process no longer exists
+        """
+        cached = self._proc_cache.get(pid)
+        if cached is not None and cached.process.is_running():
+            return cached
+            
+        process = psutil.Process(pid)
+        info = process.as_dict(attrs=['name', 'username', 'create_time'], ad_value=None)
+        cached = _CachedProcess(
+            process=process,
+            name=info['name'] or '',
+            username=info['username'] or '',
+            create_time=info['create_time']
+        )
+        self._proc_cache[pid] = cached
+        return cached
+    
+    def _read_cached_process(self, pid: int) -> Optional[ProcessInfo]:
+        """
+        Get information about a process through its cached psutil handle.
+        
+        Args:
+            pid: Process ID
+            
+        Returns:
+            Optional[ProcessInfo]: Process information if available, None if process cannot be accessed
+        """
+        try:
+            cached = self._get_cached_process(pid)
+            with cached.process.oneshot():
+                memory_info = cached.process.memory_info()
+                cpu_percent = cached.process.cpu_percent()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Could not access process {pid}: {str(e)}")
+            return None
+        return ProcessInfo(
+            pid=pid,
+            name=cached.name,
+            username=cached.username,
+            memory_mb=memory_info.vms / BYTES_PER_MB,
+            create_time=cached.create_time,
+            cpu_percent=cpu_percent
+        )
+    
     def get_all_processes(self) -> List[ProcessInfo]:
         """
         Get information about all running processes.
         
+        On Linux /proc is parsed directly (see _iter_processes_linux). Elsewhere
+        process handles are kept between calls, so only memory usage and CPU
+        percentage are read again for processes seen before. Large process
+        tables are read by a thread pool, since the work is mostly /proc I/O
+        during which the GIL is released.
+        
         Returns:
             List[ProcessInfo]: List of process information objects
         """
-        processes = []
-        for proc in psutil.process_iter(['pid']):
-            if info := self.get_process_info(proc):
-                processes.append(info)
+        if not self._has_full_baseline:
+            # Without a previous sample every reading would be 0.0: take one
+            # cheap snapshot of all processes and let a single short sleep
+            # cover the whole table
+            self._prime_cpu_samples()
+            time.sleep(CPU_SAMPLE_INTERVAL)
+            
+        pids = psutil.pids()
+        if len(pids) < PARALLEL_MIN_PROCESSES or MAX_SCAN_WORKERS < 2:
+            processes = self._collect_processes(pids, None)
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as pool:
+                processes = self._collect_processes(pids, pool)
+        self._has_full_baseline = True
+        return processes
+    
+    def _collect_processes(
+        self,
+        pids: List[int],
+        pool: Optional[ThreadPoolExecutor]
+    ) -> List[ProcessInfo]:
+        """
+        Read the given processes, serially or on a thread pool.
+        
+        Args:
+            pids: IDs of every running process
+            pool: Executor to read processes on, None to read them serially
+            
+        Returns:
+            List[ProcessInfo]: Information about the processes that could be read
+        """
+        if _IS_LINUX:
+            return list(self._iter_processes_linux(pids=pids, pool=pool))
+            
+        mapper = pool.map if pool is not None else map
+        processes = [info for info in mapper(self._read_cached_process, pids) if info]
+            
+        # Evict handles of processes that have exited
+        live_pids = set(pids)
+        for pid in list(self._proc_cache):
+            if pid not in live_pids:
+                del self._proc_cache[pid]
         return processes
     
+    def _prime_cpu_samples(self, needle: Optional[str] = None) -> int:
+        """
+        Record a CPU time snapshot of processes without collecting anything else.
+        
+        The next pass over those processes measures CPU usage against it.
+        
+        Args:
+            needle: Lower-cased substring the process name must contain; only
+                matching processes without a sample are primed. None primes
+                every process.
+            
+        Returns:
+            int: Number of processes primed
+        """
+        primed = 0
+        if not _IS_LINUX:
+            if needle is None:
+                pids = psutil.pids()
+            else:
+                pids = [
+                    proc.pid
+                    for proc in psutil.process_iter(attrs=['name'], ad_value=None)
+                    if needle in (proc.info['name'] or '').lower()
+                    and proc.pid not in self._proc_cache
+                ]
+            for pid in pids:
+                try:
+                    self._get_cached_process(pid).process.cpu_percent()
+                    primed += 1
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+            return primed
+            
+        now = time.monotonic()
+        for pid in psutil.pids():
+            try:
+                with open(f'/proc/{pid}/stat', 'rb') as f:
+                    stat = f.read()
+                name_end = stat.rfind(b')')
+                if needle is not None and needle not in self._stat_name(pid, stat).lower():
+                    continue
+            except OSError:
+                continue
+            fields = stat[name_end + 2:].split()
+            key = (pid, int(fields[19]))
+            if needle is not None and key in self._cpu_samples:
+                continue
+            self._cpu_samples[key] = (int(fields[11]) + int(fields[12]), now)
+            primed += 1
+        return primed
+    
+    def _iter_processes_linux(
+        self,
+        needle: Optional[str] = None,
+        pids: Optional[List[int]] = None,
+        pool: Optional[ThreadPoolExecutor] = None
+    ) -> Iterator[ProcessInfo]:
+        """
+        Yield information about running processes by reading /proc directly.
+        
+        CPU percentage is computed from the change in CPU ticks since the
+        previous pass, like psutil's cpu_percent.
+        
+        Args:
+            needle: Lower-cased substring the process name must contain; status
+                is only read for matching processes. None yields every process.
+            pids: IDs of the processes to read, None to list /proc
+            pool: Executor to read processes on, None to read them serially
+            
+        Yields:
+            ProcessInfo: Information about each (matching) process
+        """
+        cpu_samples: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        now = time.monotonic()
+        if pids is None:
+            pids = psutil.pids()
+            
+        def read(pid: int) -> Optional[Tuple[int, int, ProcessInfo]]:
+            return self._read_process_linux(pid, needle, now)
+            
+        mapper = pool.map if pool is not None else map
+        try:
+            for result in mapper(read, pids):
+                if result is None:
+                    continue
+                start_ticks, cpu_ticks, info = result
+                cpu_samples[(info.pid, start_ticks)] = (cpu_ticks, now)
+                yield info
+        finally:
+            if needle is None:
+                # A full pass replaces the samples, dropping exited processes
+                self._cpu_samples = cpu_samples
+            else:
+                self._cpu_samples.update(cpu_samples)
+    
+    def _read_process_linux(
+        self,
+        pid: int,
+        needle: Optional[str],
+        now: float
+    ) -> Optional[Tuple[int, int, ProcessInfo]]:
+        """
+        Read one process from /proc/<pid>/stat and /proc/<pid>/status.
+        
+        Each process costs at most these two reads, instead of one per psutil
+        accessor. Safe to call from several threads at once.
+        
+        Args:
+            pid: Process ID
+            needle: Lower-cased substring the process name must contain, or None
+            now: Monotonic time of the current pass
+            
+        Returns:
+            Optional[Tuple[int, int, ProcessInfo]]: Start ticks, CPU ticks and
+            process information, None if the process is gone or does not match
+        """
+        try:
+            with open(f'/proc/{pid}/stat', 'rb') as f:
+                stat = f.read()
+                
+            # The name may contain spaces and parentheses, so split around
+            # the last ')'; fields[0] is then field 3 (state) of proc(5)
+            name_end = stat.rfind(b')')
+            name = self._stat_name(pid, stat)
+            if needle is not None and needle not in name.lower():
+                return None
+                
+            with open(f'/proc/{pid}/status', 'rb') as f:
+                status = f.read()
+        except OSError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Could not access process {pid}: {str(e)}")
+            return None
+            
+        fields = stat[name_end + 2:].split()
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        start_ticks = int(fields[19])  # starttime
+        vsize = int(fields[20])  # virtual memory size in bytes
+        uid = int(status[status.index(b'\nUid:') + 5:].split(None, 1)[0])
+        
+        cpu_percent = 0.0
+        previous = self._cpu_samples.get((pid, start_ticks))
+        if previous is not None and now > previous[1]:
+            cpu_seconds = (cpu_ticks - previous[0]) / _CLK_TCK
+            cpu_percent = round(cpu_seconds / (now - previous[1]) * 100, 1)
+            
+        return start_ticks, cpu_ticks, ProcessInfo(
+            pid=pid,
+            name=name,
+            username=_username_for_uid(uid),
+            memory_mb=vsize / BYTES_PER_MB,
+            create_time=self._boot_time + start_ticks / _CLK_TCK,
+            cpu_percent=cpu_percent
+        )
+    
+    @classmethod
+    def _stat_name(cls, pid: int, stat: bytes) -> str:
+        """
+        Extract the process name from the contents of /proc/<pid>/stat.
+        
+        Args:
+            pid: Process ID
+            stat: Contents of /proc/<pid>/stat
+            
+        Returns:
+            str: Process name, expanded if the kernel truncated it
+        """
+        name = stat[stat.find(b'(') + 1:stat.rfind(b')')].decode(errors='replace')
+        if len(name) >= 15:
+            name = cls._expand_truncated_name(pid, name)
+        return name
+    
+    @staticmethod
+    def _expand_truncated_name(pid: int, name: str) -> str:
+        """
+        Recover a process name the kernel truncated to 15 characters.
+        
+        Mirrors psutil, which takes the full name from the command line when
+        it starts with the truncated one.
+        
+        Args:
+            pid: Process ID
+            name: Name as reported by /proc/<pid>/stat
+            
+        Returns:
+            str: Full process name if it can be recovered, otherwise ``name``
+        """
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                argv0 = f.read().split(b'\0', 1)[0]
+        except OSError:
+            return name
+        full_name = os.path.basename(argv0.decode(errors='replace'))
+        return full_name if full_name.startswith(name) else name
+    
     def find_processes_by_name(self, name: str) -> List[ProcessInfo]:
         """
         Find all processes matching a given name.
         
+        Matches without a previous CPU sample are primed first, so their CPU
+        percentage is measured rather than reported as 0.0.
+        
         Args:
             name: Name of the process to find (case-insensitive)
             
         Returns:
             List[ProcessInfo]: List of matching process information objects
         """
-        return [
-            proc for proc in self.get_all_processes()
-            if name.lower() in proc.name.lower()
-        ]
+        return list(self.iter_processes_by_name(name, measure_cpu=True))
+    
+    def iter_processes_by_name(self, name: str, measure_cpu: bool = False) -> Iterator[ProcessInfo]:
+        """
+        Lazily yield processes matching a given name.
+        
+        Only the name is read for non-matching processes; the remaining
+        details are fetched for matches only, so stopping early saves work.
+        Without measure_cpu, processes not sampled by an earlier pass report
+        a CPU percentage of 0.0.
+        
+        Args:
+            name: Name of the process to find (case-insensitive)
+            measure_cpu: Prime every unsampled match and wait CPU_SAMPLE_INTERVAL
+                before yielding anything. This costs a pass over the whole
+                process table, so early exit no longer saves work.
+            
+        Yields:
+            ProcessInfo: Information about each matching process
+        """
+        needle = name.lower()
+        if measure_cpu and self._prime_cpu_samples(needle):
+            # Matches seen for the first time have no CPU sample to measure against
+            time.sleep(CPU_SAMPLE_INTERVAL)
+            
+        if _IS_LINUX:
+            yield from self._iter_processes_linux(needle)
+            return
+            
+        for proc in psutil.process_iter(attrs=['name'], ad_value=None):
+            if needle in (proc.info['name'] or '').lower():
+                if info := self._read_cached_process(proc.pid):
+                    yield info
     
     def get_system_info(self) -> Dict[str, Any]:
         """
         Get general system information.
         
+        CPU usage is measured since the previous call (or since the monitor
+        was created), so this does not block.
+        
         Returns:
             Dict[str, Any]: Dictionary containing system information
         """
         return {
-            'cpu_percent': psutil.cpu_percent(interval=1),
+            'cpu_percent': psutil.cpu_percent(interval=None),
             'memory_percent': psutil.virtual_memory().percent,
             'total_processes': len(psutil.pids()),
-            'boot_time': datetime.fromtimestamp(psutil.boot_time()).isoformat()
+            'boot_time': self._boot_time_iso
         }
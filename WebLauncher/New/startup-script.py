@@ -16,16 +16,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class StartupManager:
-    def __init__(self):
-        self.username = os.getenv('USERNAME') or os.getenv('USER')
-        self.startup_path = pathlib.Path(
-            f'C:/Users/{self.username}/AppData/Roaming/Microsoft/Windows/Start Menu/Programs/Startup'
-        )
+    RUN_KEY = r'Software\Microsoft\Windows\CurrentVersion\Run'
+    VALUE_NAME = 'WebLauncher'
 
     def add_to_startup(self, file_path: Optional[str] = None) -> bool:
         """
         Add a program to Windows startup.
         
+        Registers the program under the current user's Run registry key, so
+        Windows launches it directly at logon without a cmd.exe shim. Falls
+        back to a .bat file in the Startup folder if the registry is unavailable.
+        
         Args:
             file_path: Path to the program to add to startup.
                       If None, uses the directory of the current script.
@@ -37,14 +38,12 @@ class StartupManager:
             if not file_path:
                 file_path = str(pathlib.Path(__file__).parent.resolve())
 
-            if not self.startup_path.exists():
-                logger.error(f"Startup directory not found: {self.startup_path}")
-                return False
-
-            bat_file = self.startup_path / "launcher.bat"
-            
-            with open(bat_file, "w") as f:
-                f.write(f'@echo off\nstart "" "{file_path}"\n')
+            try:
+                self._add_run_key(file_path)
+            except (ImportError, OSError) as e:
+                logger.warning(f"Could not write Run registry key ({e}), using Startup folder")
+                if not self._add_startup_bat(file_path):
+                    return False
             
             logger.info(f"Successfully added to startup: {file_path}")
             return True
@@ -53,6 +52,51 @@ class StartupManager:
             logger.error(f"Failed to add to startup: {e}")
             return False
 
+    def _add_run_key(self, file_path: str) -> None:
+        """
+        Register a program under the current user's Run registry key.
+        
+        Args:
+            file_path: Path to the program to launch at logon
+            
+        Raises:
+            ImportError: If winreg is unavailable (not running on Windows)
+            OSError: If the registry key cannot be written
+        """
+        import winreg
+
+        # Executables run directly; anything else (e.g. a folder or script) is
+        # opened through its shell association, as `start` did in the .bat file
+        if file_path.lower().endswith('.exe'):
+            command = f'"{file_path}"'
+        else:
+            command = f'explorer.exe "{file_path}"'
+
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.RUN_KEY, 0, winreg.KEY_SET_VALUE) as key:
+            winreg.SetValueEx(key, self.VALUE_NAME, 0, winreg.REG_SZ, command)
+
+    def _add_startup_bat(self, file_path: str) -> bool:
+        """
+        Write a launcher .bat file into the current user's Startup folder.
+        
+        Args:
+            file_path: Path to the program to launch at logon
+            
+        Returns:
+            bool: True if successful, False if the Startup folder does not exist
+        """
+        startup_path = pathlib.Path(
+            os.path.expandvars('%APPDATA%')
+        ) / 'Microsoft/Windows/Start Menu/Programs/Startup'
+
+        if not startup_path.is_dir():
+            logger.error(f"Startup directory not found: {startup_path}")
+            return False
+
+        with open(startup_path / "launcher.bat", "w") as f:
+            f.write(f'@echo off\nstart "" "{file_path}"\n')
+        return True
+
 def main():
     manager = StartupManager()
     success = manager.add_to_startup()
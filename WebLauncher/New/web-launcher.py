@@ -5,13 +5,16 @@ Launches specified websites from a configuration file at scheduled times
 
 import argparse
 import logging
+import os
 import pathlib
+import re
 import schedule
+import socket
+import subprocess
 import time
 import urllib3
 import webbrowser
-from typing import List, Optional
-from urllib3.exceptions import URLError
+from typing import List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -20,17 +23,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Browser executables that accept any number of URLs on one command line
+BATCH_BROWSERS = (
+    'firefox', 'google-chrome', 'chrome', 'chromium', 'msedge', 'microsoft-edge', 'brave'
+)
+
+# Longest single sleep in the scheduler loop, in seconds. time.sleep does not
+# count time spent suspended, while schedule works in wall-clock time, so a
+# short cap bounds how late a job can fire after resume or a clock change
+MAX_SLEEP_SECONDS = 60
+
 class WebLauncher:
+    # Public DNS resolver used as a connectivity probe: one TCP handshake,
+    # no DNS lookup and no HTTP exchange
+    PROBE_ADDRESS = ('1.1.1.1', 53)
+    PROBE_TIMEOUT = 2.0
+
+    _URL_RE = re.compile(rb'^https?://[^\s/]+', re.IGNORECASE)
+
     def __init__(self, config_path: pathlib.Path):
         self.config_path = config_path
-        self.http = urllib3.PoolManager(timeout=urllib3.Timeout(connect=2.0, read=2.0))
+        # ((mtime_ns, size), urls) of the last parsed configuration
+        self._cache: Optional[Tuple[Tuple[int, int], List[str]]] = None
 
     def check_internet_connection(self) -> bool:
         """Check if internet connection is available."""
         try:
-            self.http.request('GET', 'http://www.google.com')
+            sock = socket.create_connection(self.PROBE_ADDRESS, timeout=self.PROBE_TIMEOUT)
+            sock.close()
             return True
-        except URLError as err:
+        except OSError as err:
             logger.error(f"Internet connection error: {err}")
             return False
 
@@ -45,14 +67,24 @@ class WebLauncher:
         return []
 
     def read_urls_from_config(self) -> List[str]:
-        """Read and validate URLs from configuration file."""
+        """Read and validate URLs from configuration file, reparsing only when it changes."""
         try:
-            with open(self.config_path, 'r') as f:
+            stat = self.config_path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._cache is not None and self._cache[0] == key:
+                return self._cache[1]
+
+            with open(self.config_path, 'rb') as f:
                 urls = []
                 for line in f:
-                    urls.extend(self.extract_urls(line))
-                return urls
+                    line = line.strip()
+                    # Cheap regex pre-filter; only plausible URLs reach parse_url
+                    if self._URL_RE.match(line):
+                        urls.extend(self.extract_urls(line.decode()))
+            self._cache = (key, urls)
+            return urls
         except FileNotFoundError:
+            self._cache = None
             logger.error(f"Configuration file not found: {self.config_path}")
             return []
 
@@ -67,6 +99,9 @@ class WebLauncher:
             logger.warning("No valid URLs found in configuration")
             return
 
+        if self._launch_batch(urls):
+            return
+
         for url in urls:
             try:
                 webbrowser.open(url, new=2)
@@ -74,6 +109,38 @@ class WebLauncher:
             except Exception as e:
                 logger.error(f"Failed to launch {url}: {e}")
 
+    def _launch_batch(self, urls: List[str]) -> bool:
+        """
+        Open all URLs with a single browser process, if the default browser allows it.
+
+        Returns False, without opening anything, when the browser is not known
+        to accept several URLs at once (e.g. the macOS and Windows default
+        handlers), so the caller can fall back to one webbrowser.open per URL.
+        """
+        try:
+            browser = webbrowser.get()
+        except webbrowser.Error:
+            return False
+
+        binary = getattr(browser, 'name', None)
+        if not isinstance(binary, str):
+            return False
+        executable = os.path.basename(binary).lower()
+        if executable.endswith('.exe'):
+            executable = executable[:-4]
+        if not executable.startswith(BATCH_BROWSERS):
+            return False
+
+        try:
+            subprocess.Popen([binary, *urls], close_fds=True, start_new_session=True)
+        except OSError as e:
+            logger.warning(f"Could not start {binary}, opening URLs one by one: {e}")
+            return False
+
+        for url in urls:
+            logger.info(f"Launched: {url}")
+        return True
+
 def main():
     parser = argparse.ArgumentParser(
         description="WebLauncher - Automated website launcher with scheduling",
@@ -102,8 +169,12 @@ def main():
 
     try:
         while True:
+            # Sleep until the next job is due instead of polling every second,
+            # but never longer than MAX_SLEEP_SECONDS
+            idle = schedule.idle_seconds()
+            delay = MAX_SLEEP_SECONDS if idle is None else max(0.0, idle)
+            time.sleep(min(delay, MAX_SLEEP_SECONDS))
             schedule.run_pending()
-            time.sleep(1)
     except KeyboardInterrupt:
         logger.info("WebLauncher stopped by user")
     except Exception as e: